@@ -1,57 +1,74 @@
 import os
 import logging
+import time
+from functools import lru_cache
 
 from app.api.chat.engine.index import get_index
+from app.api.chat.engine.retriever_embedding_cache import RetrieverWithEmbeddingCache
 from app.api.chat.engine.retriever_fallback import RetrieverWithEmptyFallback
 from app.api.chat.engine.retriever_hybrid import HybridRetriever
-from app.db import sync_mongodb
+from app.api.chat.engine.vectordb import get_search_params
+from app.db import async_mongodb
 from fastapi import HTTPException
 from llama_index.core.chat_engine import CondensePlusContextChatEngine
 
 logger = logging.getLogger(__name__)
 
+# The system prompt changes rarely; re-read it from MongoDB at most this often (seconds)
+SYSTEM_PROMPT_CACHE_TTL = float(os.getenv("SYSTEM_PROMPT_CACHE_TTL", "60"))
+_system_prompt_cache = {"value": None, "expires": 0.0}
 
-def get_system_prompt_from_db():
-    config = sync_mongodb.db.config.find_one({"_id": "app_config"})
-    if config and "SYSTEM_PROMPT" in config:
-        return config["SYSTEM_PROMPT"]
-    return None
 
+async def get_system_prompt_from_db():
+    now = time.monotonic()
+    if now < _system_prompt_cache["expires"]:
+        return _system_prompt_cache["value"]
+    config = await async_mongodb.db.config.find_one(
+        {"_id": "app_config"}, {"SYSTEM_PROMPT": 1, "_id": 0}
+    )
+    system_prompt = config.get("SYSTEM_PROMPT") if config else None
+    _system_prompt_cache["value"] = system_prompt
+    _system_prompt_cache["expires"] = now + SYSTEM_PROMPT_CACHE_TTL
+    return system_prompt
+
+
+_IDENTITY = (
+    "You are Nyayantar AI, India's first Legal AI Agent, developed by Bizfy Solutions. "
+    "Always refer to yourself as Nyayantar (or 'I am Nyayantar'). When asked who built or developed you, say Bizfy Solutions. "
+    "You specialize in Indian legal matters."
+)
+_LANGUAGE_RULE = (
+    "Users may ask in Hindi, Hinglish, or English. "
+    "Understand the language of the user's query and answer in the same language (Hindi, Hinglish, or English) accordingly."
+)
+_LEGAL_CONTEXT = (
+    "You have access to Indian legal knowledge (IPC, CrPC, CPC, IEA, family laws, etc.) and, when provided, "
+    "web search results for up-to-date or factual information. "
+    "For legal questions: use the provided context (documents and any web sources), reference sections/acts when relevant, "
+    "explain simply, and state this is educational not legal advice. "
+    "When context includes web sources (marked with 'Source: ...'), prefer citing them for factual or recent information to reduce hallucination."
+)
+_DISCLAIMER_AND_CONTACT = (
+    "Disclaimer: If the user requires legal assistance (e.g. representation, case-specific advice, or expert help), "
+    "we can assist by connecting them to legal experts. "
+    "When the user asks for contact details, legal assistance, or how to get in touch with Nyayantar for expert help, "
+    "provide these contact details: Email: hello@nyayantar.com, Phone: +918103682787."
+)
+_REDIRECT_RULE = (
+    "If the question is not about law or legal matters (e.g. medical, technical, financial, tax, cooking, sports, identification of people/things), "
+    "do not use the retrieved context. Reply briefly as Nyayantar and suggest the user consult the right expert "
+    "(e.g. medical→doctor, technical→IT professional, financial→advisor, tax→CA, recipes→culinary expert). "
+    "Keep it to one short sentence."
+)
 
+
+@lru_cache(maxsize=8)
 def get_enhanced_system_prompt(base_prompt: str) -> str:
-    identity = (
-        "You are Nyayantar AI, India's first Legal AI Agent, developed by Bizfy Solutions. "
-        "Always refer to yourself as Nyayantar (or 'I am Nyayantar'). When asked who built or developed you, say Bizfy Solutions. "
-        "You specialize in Indian legal matters."
-    )
-    language_rule = (
-        "Users may ask in Hindi, Hinglish, or English. "
-        "Understand the language of the user's query and answer in the same language (Hindi, Hinglish, or English) accordingly."
-    )
-    legal_context = (
-        "You have access to Indian legal knowledge (IPC, CrPC, CPC, IEA, family laws, etc.) and, when provided, "
-        "web search results for up-to-date or factual information. "
-        "For legal questions: use the provided context (documents and any web sources), reference sections/acts when relevant, "
-        "explain simply, and state this is educational not legal advice. "
-        "When context includes web sources (marked with 'Source: ...'), prefer citing them for factual or recent information to reduce hallucination."
-    )
-    disclaimer_and_contact = (
-        "Disclaimer: If the user requires legal assistance (e.g. representation, case-specific advice, or expert help), "
-        "we can assist by connecting them to legal experts. "
-        "When the user asks for contact details, legal assistance, or how to get in touch with Nyayantar for expert help, "
-        "provide these contact details: Email: hello@nyayantar.com, Phone: +918103682787."
-    )
-    redirect_rule = (
-        "If the question is not about law or legal matters (e.g. medical, technical, financial, tax, cooking, sports, identification of people/things), "
-        "do not use the retrieved context. Reply briefly as Nyayantar and suggest the user consult the right expert "
-        "(e.g. medical→doctor, technical→IT professional, financial→advisor, tax→CA, recipes→culinary expert). "
-        "Keep it to one short sentence."
-    )
-    return f"{identity}\n\n{language_rule}\n\n{base_prompt}\n\n{legal_context}\n\n{disclaimer_and_contact}\n\n{redirect_rule}"
+    return f"{_IDENTITY}\n\n{_LANGUAGE_RULE}\n\n{base_prompt}\n\n{_LEGAL_CONTEXT}\n\n{_DISCLAIMER_AND_CONTACT}\n\n{_REDIRECT_RULE}"
 
 
-def get_chat_engine(filters=None, params=None, query=None, event_handler=None):
-    system_prompt = get_system_prompt_from_db()
+async def get_chat_engine(filters=None, params=None, query=None, event_handler=None):
+    system_prompt = await get_system_prompt_from_db()
     if system_prompt is None:
         system_prompt = os.getenv("SYSTEM_PROMPT", "You are Nyayantar AI, a helpful AI assistant.")
     system_prompt = get_enhanced_system_prompt(system_prompt)
@@ -64,10 +81,13 @@ def get_chat_engine(filters=None, params=None, query=None, event_handler=None):
         )
 
     top_k = int(os.getenv("TOP_K", 0))
+    search_params = get_search_params()
     base_retriever = index.as_retriever(
-        filters=filters, **({"similarity_top_k": top_k} if top_k != 0 else {})
+        filters=filters,
+        **({"similarity_top_k": top_k} if top_k != 0 else {}),
+        **({"vector_store_kwargs": {"search_params": search_params}} if search_params else {}),
     )
-    kb_retriever = RetrieverWithEmptyFallback(base_retriever)
+    kb_retriever = RetrieverWithEmptyFallback(RetrieverWithEmbeddingCache(base_retriever))
     retriever = HybridRetriever(kb_retriever, event_handler=event_handler)
 
     return CondensePlusContextChatEngine.from_defaults(
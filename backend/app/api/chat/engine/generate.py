@@ -7,7 +7,7 @@ import logging
 import os
 
 from app.api.chat.engine.loaders import get_documents
-from app.api.chat.engine.vectordb import get_vector_store
+from app.api.chat.engine.vectordb import get_quantization_config, get_vector_store
 from app.settings import init_settings
 from llama_index.core.ingestion import IngestionPipeline
 from llama_index.core.node_parser import SentenceSplitter
@@ -19,6 +19,8 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
 STORAGE_DIR = os.getenv("STORAGE_DIR", "storage")
+# Number of worker processes for the ingestion pipeline (unset = run in-process)
+INGEST_NUM_WORKERS = os.getenv("INGEST_NUM_WORKERS")
 
 
 def get_doc_store():
@@ -45,11 +47,29 @@ def run_pipeline(docstore, vector_store, documents):
     )
 
     # Run the ingestion pipeline and store the results
-    nodes = pipeline.run(show_progress=True, documents=documents)
+    nodes = pipeline.run(
+        show_progress=True,
+        documents=documents,
+        num_workers=int(INGEST_NUM_WORKERS) if INGEST_NUM_WORKERS else None,
+    )
 
     return nodes
 
 
+def apply_quantization(vector_store):
+    # quantization_config only applies when the store creates the collection,
+    # so switch an already existing collection over explicitly
+    quantization_config = get_quantization_config()
+    if quantization_config is None:
+        return
+    client = vector_store.client
+    if client.collection_exists(vector_store.collection_name):
+        client.update_collection(
+            collection_name=vector_store.collection_name,
+            quantization_config=quantization_config,
+        )
+
+
 def persist_storage(docstore, vector_store):
     storage_context = StorageContext.from_defaults(
         docstore=docstore,
@@ -72,6 +92,7 @@ def generate_datasource():
 
     # Run the ingestion pipeline
     _ = run_pipeline(docstore, vector_store, documents)
+    apply_quantization(vector_store)
 
     # Build the index and persist storage
     persist_storage(docstore, vector_store)
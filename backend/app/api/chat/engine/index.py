@@ -1,5 +1,5 @@
 import logging
-import os
+import threading
 
 from llama_index.core.indices import VectorStoreIndex
 from llama_index.core.settings import Settings
@@ -9,15 +9,19 @@ from app.api.chat.engine.vectordb import get_vector_store
 logger = logging.getLogger(__name__)
 
 _index = None
+_index_lock = threading.Lock()
 
 
 def get_index(params=None):
     global _index
     if _index is not None:
         return _index
-    store = get_vector_store()
-    _index = VectorStoreIndex.from_vector_store(
-        store,
-        embed_model=Settings.embed_model,
-    )
+    # Double-checked so concurrent first requests build the index only once
+    with _index_lock:
+        if _index is None:
+            store = get_vector_store()
+            _index = VectorStoreIndex.from_vector_store(
+                store,
+                embed_model=Settings.embed_model,
+            )
     return _index
@@ -1,16 +1,19 @@
 import os
 import logging
-from typing import Dict
-from llama_parse import LlamaParse
+from typing import TYPE_CHECKING, Dict, Optional
 from pydantic import BaseModel
 
 from app.config import DATA_DIR
 
+if TYPE_CHECKING:
+    from llama_parse import LlamaParse
+
 logger = logging.getLogger(__name__)
 
 
 class FileLoaderConfig(BaseModel):
     use_llama_parse: bool = False
+    num_workers: Optional[int] = None
 
 
 def llama_parse_parser():
@@ -19,6 +22,9 @@ def llama_parse_parser():
             "LLAMA_CLOUD_API_KEY environment variable is not set. "
             "Please set it in .env file or in your shell environment then run again!"
         )
+    # Imported here so plain file loading doesn't pay for llama_parse's import
+    from llama_parse import LlamaParse
+
     parser = LlamaParse(
         result_type="markdown",
         verbose=True,
@@ -28,7 +34,7 @@ def llama_parse_parser():
     return parser
 
 
-def llama_parse_extractor() -> Dict[str, LlamaParse]:
+def llama_parse_extractor() -> Dict[str, "LlamaParse"]:
     from llama_parse.utils import SUPPORTED_FILE_TYPES
 
     parser = llama_parse_parser()
@@ -55,7 +61,7 @@ def get_file_documents(config: FileLoaderConfig):
             raise_on_error=True,
             file_extractor=file_extractor,
         )
-        return reader.load_data()
+        return reader.load_data(num_workers=config.num_workers)
     except Exception as e:
         import sys
         import traceback
@@ -0,0 +1,62 @@
+"""Retriever wrapper that memoizes query embeddings.
+
+The embedding call is the main pre-retrieval cost of every chat turn. Repeated
+questions (retries, regenerations, common queries) reuse the cached vector so
+the wrapped vector retriever skips the embed model entirely.
+Env: QUERY_EMBEDDING_CACHE_SIZE  Max cached queries; "0" disables the cache (default: "2048").
+"""
+import os
+import threading
+from typing import List, Optional, Tuple
+
+from cachetools import LRUCache
+from llama_index.core.base.base_retriever import BaseRetriever
+from llama_index.core.indices.query.schema import QueryBundle
+from llama_index.core.schema import NodeWithScore
+from llama_index.core.settings import Settings
+
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "2048"))
+
+# Shared across chat engines: a new engine (and retriever chain) is built per request
+_embedding_cache = LRUCache(maxsize=max(QUERY_EMBEDDING_CACHE_SIZE, 1))
+_embedding_cache_lock = threading.Lock()
+
+
+class RetrieverWithEmbeddingCache(BaseRetriever):
+    """Wraps a vector retriever and fills query_bundle.embedding from an LRU cache."""
+
+    def __init__(self, retriever: BaseRetriever, **kwargs):
+        super().__init__(**kwargs)
+        self._retriever = retriever
+        self._enabled = QUERY_EMBEDDING_CACHE_SIZE > 0
+
+    def _cache_key(self, query_bundle: QueryBundle) -> Optional[Tuple[str, ...]]:
+        if not self._enabled or query_bundle.embedding is not None:
+            return None
+        if not query_bundle.embedding_strs:
+            return None
+        return tuple(query_bundle.embedding_strs)
+
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        key = self._cache_key(query_bundle)
+        if key is not None:
+            with _embedding_cache_lock:
+                embedding = _embedding_cache.get(key)
+            if embedding is None:
+                embedding = Settings.embed_model.get_agg_embedding_from_queries(list(key))
+                with _embedding_cache_lock:
+                    _embedding_cache[key] = embedding
+            query_bundle.embedding = embedding
+        return self._retriever._retrieve(query_bundle)
+
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        key = self._cache_key(query_bundle)
+        if key is not None:
+            with _embedding_cache_lock:
+                embedding = _embedding_cache.get(key)
+            if embedding is None:
+                embedding = await Settings.embed_model.aget_agg_embedding_from_queries(list(key))
+                with _embedding_cache_lock:
+                    _embedding_cache[key] = embedding
+            query_bundle.embedding = embedding
+        return await self._retriever._aretrieve(query_bundle)
@@ -5,16 +5,18 @@ Retrieves from both sources and merges results so the chat engine gets:
 - Your indexed legal/docs content (high relevance when it matches).
 - Fresh web results (factual, up-to-date) to reduce hallucination.
 
-Order: KB nodes first (by score), then web nodes. The LLM sees a single
+Order: KB nodes first (by score), then web nodes; nodes whose text repeats
+an earlier one are dropped. The LLM sees a single
 context block with clear source labels (metadata.source = "web" vs doc).
 
 When an event_handler is provided, pushes a "Searched web for '...' (N results)"
 event so it shows in the UI events list.
 Env: ENABLE_WEB_SEARCH  Set to "false"/"0" to disable web search (default: "true").
 """
+import asyncio
 import logging
 import os
-from typing import List, Optional
+from typing import List
 
 from llama_index.core.base.base_retriever import BaseRetriever
 from llama_index.core.schema import NodeWithScore
@@ -27,6 +29,19 @@ logger = logging.getLogger(__name__)
 ENABLE_WEB_SEARCH = os.getenv("ENABLE_WEB_SEARCH", "true").lower() in ("true", "1", "yes")
 
 
+def _merge_nodes(nodes: List[NodeWithScore], web_nodes: List[NodeWithScore]) -> List[NodeWithScore]:
+    """KB nodes then web nodes, dropping repeated texts so they don't waste context tokens."""
+    seen = set()
+    merged = []
+    for node in [*nodes, *web_nodes]:
+        text = node.node.get_content()
+        if text in seen:
+            continue
+        seen.add(text)
+        merged.append(node)
+    return merged
+
+
 class HybridRetriever(BaseRetriever):
     """
     Wraps an existing retriever and adds web search results to the context.
@@ -48,32 +63,37 @@ class HybridRetriever(BaseRetriever):
         self._enable_web = enable_web_search if enable_web_search is not None else ENABLE_WEB_SEARCH
         self._event_handler = event_handler
 
+    def _search_web(self, query: str) -> List[NodeWithScore]:
+        try:
+            return web_search_to_nodes(query)
+        except Exception as e:
+            logger.warning("Web search in hybrid retriever failed: %s", e)
+            return []
+
+    def _push_web_event(self, query: str, web_nodes: List[NodeWithScore]) -> None:
+        if self._event_handler and web_nodes:
+            q = query[:60] + ("..." if len(query) > 60 else "")
+            self._event_handler.push_custom_event(
+                f"Searched web for: \"{q}\" ({len(web_nodes)} results)"
+            )
+
     def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         nodes = self._retriever._retrieve(query_bundle)
         if self._enable_web and query_bundle.query_str.strip():
-            try:
-                web_nodes = web_search_to_nodes(query_bundle.query_str)
-                nodes = list(nodes) + web_nodes
-                if self._event_handler and web_nodes:
-                    q = query_bundle.query_str[:60] + ("..." if len(query_bundle.query_str) > 60 else "")
-                    self._event_handler.push_custom_event(
-                        f"Searched web for: \"{q}\" ({len(web_nodes)} results)"
-                    )
-            except Exception as e:
-                logger.warning("Web search in hybrid retriever failed: %s", e)
+            web_nodes = self._search_web(query_bundle.query_str)
+            self._push_web_event(query_bundle.query_str, web_nodes)
+            nodes = _merge_nodes(nodes, web_nodes)
         return nodes
 
     async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
-        nodes = await self._retriever._aretrieve(query_bundle)
-        if self._enable_web and query_bundle.query_str.strip():
-            try:
-                web_nodes = web_search_to_nodes(query_bundle.query_str)
-                nodes = list(nodes) + web_nodes
-                if self._event_handler and web_nodes:
-                    q = query_bundle.query_str[:60] + ("..." if len(query_bundle.query_str) > 60 else "")
-                    self._event_handler.push_custom_event(
-                        f"Searched web for: \"{q}\" ({len(web_nodes)} results)"
-                    )
-            except Exception as e:
-                logger.warning("Web search in hybrid retriever failed: %s", e)
-        return nodes
+        if not (self._enable_web and query_bundle.query_str.strip()):
+            return await self._retriever._aretrieve(query_bundle)
+        # The KB lookup and the (blocking) web search are independent, so run them
+        # concurrently; the web search goes to a thread to keep the event loop free
+        nodes, web_nodes = await asyncio.gather(
+            self._retriever._aretrieve(query_bundle),
+            asyncio.to_thread(self._search_web, query_bundle.query_str),
+        )
+        # Push the event from the loop thread: the handler's asyncio.Queue isn't thread-safe
+        self._push_web_event(query_bundle.query_str, web_nodes)
+        return _merge_nodes(nodes, web_nodes)
@@ -1,6 +1,80 @@
 import os
+import threading
+
 import qdrant_client
 from llama_index.vector_stores.qdrant import QdrantVectorStore
+from qdrant_client.http import models as rest
+
+# One store per collection, reused across requests
+_stores = {}
+# Sync/async client pair shared by every store and the health check
+_clients = None
+_clients_lock = threading.Lock()
+
+
+def get_quantization_config():
+    """
+    Scalar quantization config selected by QDRANT_QUANTIZATION ("int8" enables it).
+
+    int8 vectors cut memory traffic per candidate ~4x; searches rescore the top
+    candidates against the original vectors (see get_search_params).
+    """
+    if os.getenv("QDRANT_QUANTIZATION", "").lower() != "int8":
+        return None
+    return rest.ScalarQuantization(
+        scalar=rest.ScalarQuantizationConfig(
+            type=rest.ScalarType.INT8,
+            always_ram=True,
+        )
+    )
+
+
+def get_search_params():
+    """Search params that rescore quantized results, or None when quantization is off."""
+    if get_quantization_config() is None:
+        return None
+    return rest.SearchParams(
+        quantization=rest.QuantizationSearchParams(
+            ignore=False,
+            rescore=True,
+            oversampling=2.0,
+        )
+    )
+
+
+def get_qdrant_clients():
+    """
+    Get the process-wide Qdrant clients, created on first use
+
+    Returns:
+        (QdrantClient, AsyncQdrantClient) tuple sharing one configuration
+    """
+    global _clients
+    if _clients is not None:
+        return _clients
+    with _clients_lock:
+        if _clients is None:
+            QDRANT_URL = os.getenv("QDRANT_URL")
+            QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
+            if not QDRANT_URL:
+                raise ValueError(
+                    "Please set QDRANT_URL"
+                    " to your environment variables or config them in the .env file"
+                )
+
+            client_kwargs = {"url": QDRANT_URL}
+            if QDRANT_API_KEY:
+                client_kwargs["api_key"] = QDRANT_API_KEY
+            # gRPC is much cheaper per request than REST; opt in when the gRPC port is reachable
+            if os.getenv("QDRANT_PREFER_GRPC", "false").lower() in ("true", "1"):
+                client_kwargs["prefer_grpc"] = True
+                client_kwargs["grpc_port"] = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+
+            _clients = (
+                qdrant_client.QdrantClient(**client_kwargs),
+                qdrant_client.AsyncQdrantClient(**client_kwargs),
+            )
+    return _clients
 
 
 def get_vector_store(collection_name=None):
@@ -15,9 +89,12 @@ def get_vector_store(collection_name=None):
     """
     if collection_name is None:
         collection_name = os.getenv("QDRANT_COLLECTION", "nyayantar")
+    if collection_name in _stores:
+        return _stores[collection_name]
     
     QDRANT_URL = os.getenv("QDRANT_URL")
-    QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
+    # Points per upsert request when ingesting nodes
+    QDRANT_BATCH_SIZE = int(os.getenv("QDRANT_BATCH_SIZE", "256"))
     
     if not collection_name or not QDRANT_URL:
         raise ValueError(
@@ -25,31 +102,13 @@ def get_vector_store(collection_name=None):
             " to your environment variables or config them in the .env file"
         )
     
-    if QDRANT_API_KEY:
-        # creating a qdrant client instance
-        client = qdrant_client.QdrantClient(
-            url=QDRANT_URL,
-            api_key=QDRANT_API_KEY,
-        )
-
-        aclient = qdrant_client.AsyncQdrantClient(
-            url=QDRANT_URL,
-            api_key=QDRANT_API_KEY,
-        )
-
-        store = QdrantVectorStore(
-            client=client, aclient=aclient, collection_name=collection_name
-        )
-    else:
-        client = qdrant_client.QdrantClient(
-            url=QDRANT_URL,
-        )
-
-        aclient = qdrant_client.AsyncQdrantClient(
-            url=QDRANT_URL,
-        )
-
-        store = QdrantVectorStore(
-            client=client, aclient=aclient, collection_name=collection_name
-        )
+    client, aclient = get_qdrant_clients()
+    store = QdrantVectorStore(
+        client=client,
+        aclient=aclient,
+        collection_name=collection_name,
+        batch_size=QDRANT_BATCH_SIZE,
+        quantization_config=get_quantization_config(),
+    )
+    _stores[collection_name] = store
     return store
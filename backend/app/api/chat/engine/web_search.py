@@ -11,26 +11,44 @@ retrieval and passed to the chat engine as additional context.
 Env (optional):
   WEB_SEARCH_MAX_RESULTS   Max number of web results to add (default: 5).
   WEB_SEARCH_SNIPPET_MAX_CHARS  Max chars per snippet (default: 500).
+  WEB_SEARCH_CACHE_TTL     Seconds to reuse results for a repeated query (default: 600, 0 disables).
+  WEB_SEARCH_CACHE_SIZE    Max cached queries (default: 1024).
 """
 import logging
 import os
+import threading
 from typing import List
 
+from cachetools import TTLCache
+
 from llama_index.core.schema import NodeWithScore, TextNode
 
+try:
+    from duckduckgo_search import DDGS
+except ImportError:
+    DDGS = None
+
 logger = logging.getLogger(__name__)
 
 # Max web results to add to context (avoids token explosion)
 WEB_SEARCH_MAX_RESULTS = int(os.getenv("WEB_SEARCH_MAX_RESULTS", "5"))
 # Max chars per snippet to include
 WEB_SEARCH_SNIPPET_MAX_CHARS = int(os.getenv("WEB_SEARCH_SNIPPET_MAX_CHARS", "500"))
+# Repeated questions (retries, regenerations) reuse recent results instead of re-querying
+WEB_SEARCH_CACHE_TTL = int(os.getenv("WEB_SEARCH_CACHE_TTL", "600"))
+WEB_SEARCH_CACHE_SIZE = int(os.getenv("WEB_SEARCH_CACHE_SIZE", "1024"))
+
+_results_cache = TTLCache(maxsize=WEB_SEARCH_CACHE_SIZE, ttl=max(WEB_SEARCH_CACHE_TTL, 1))
+# Searches run in worker threads (see HybridRetriever)
+_results_cache_lock = threading.Lock()
 
 
 def _run_duckduckgo(query: str) -> List[dict]:
     """Run DuckDuckGo text search. Returns list of {title, body, href}."""
+    if DDGS is None:
+        logger.warning("Web search failed: duckduckgo_search is not installed")
+        return []
     try:
-        from duckduckgo_search import DDGS
-
         with DDGS() as ddgs:
             results = list(
                 ddgs.text(
@@ -53,6 +71,23 @@ def _run_duckduckgo(query: str) -> List[dict]:
         return []
 
 
+def _search_cached(query: str) -> List[dict]:
+    """_run_duckduckgo with a TTL cache keyed on the case/whitespace-normalized query."""
+    if WEB_SEARCH_CACHE_TTL <= 0:
+        return _run_duckduckgo(query)
+    key = " ".join(query.lower().split())
+    with _results_cache_lock:
+        cached = _results_cache.get(key)
+    if cached is not None:
+        return cached
+    results = _run_duckduckgo(query)
+    # Don't cache failures/empty results so the next request retries the search
+    if results:
+        with _results_cache_lock:
+            _results_cache[key] = results
+    return results
+
+
 def web_search_to_nodes(query: str) -> List[NodeWithScore]:
     """
     Run web search for `query` and return results as LlamaIndex NodeWithScore list.
@@ -61,7 +96,7 @@ def web_search_to_nodes(query: str) -> List[NodeWithScore]:
     Score is fixed (e.g. 0.7) so they are used as supplementary context;
     knowledge-base results typically have higher similarity scores.
     """
-    raw = _run_duckduckgo(query)
+    raw = _search_cached(query)
     nodes: List[NodeWithScore] = []
     for i, r in enumerate(raw):
         title = (r.get("title") or "").strip()
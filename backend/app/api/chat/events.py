@@ -10,6 +10,15 @@ from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Events that never produce a UI message; skipped before a CallbackEvent is built
+_IGNORED_EVENTS = (
+    CBEventType.CHUNKING,
+    CBEventType.NODE_PARSING,
+    CBEventType.EMBEDDING,
+    CBEventType.LLM,
+    CBEventType.TEMPLATING,
+)
+
 
 class CallbackEvent(BaseModel):
     event_type: CBEventType
@@ -109,14 +118,7 @@ class EventCallbackHandler(BaseCallbackHandler):
         self,
     ):
         """Initialize the base callback handler."""
-        ignored_events = [
-            CBEventType.CHUNKING,
-            CBEventType.NODE_PARSING,
-            CBEventType.EMBEDDING,
-            CBEventType.LLM,
-            CBEventType.TEMPLATING,
-        ]
-        super().__init__(ignored_events, ignored_events)
+        super().__init__(_IGNORED_EVENTS, _IGNORED_EVENTS)
         self._aqueue = asyncio.Queue()
 
     def on_event_start(
@@ -1,14 +1,5 @@
-import json
 import logging
-from typing import Optional
-from fastapi import (
-    APIRouter,
-    HTTPException,
-    Request,
-    status,
-)
-from fastapi.responses import StreamingResponse
-from llama_index.core.llms import MessageRole
+from fastapi import APIRouter, Request
 
 from app.api.chat.events import EventCallbackHandler
 from app.api.chat.models import ChatData
@@ -30,74 +21,43 @@ async def guest_chat(
     Guest chat endpoint for unauthenticated users.
     Does not require authentication or conversation persistence.
     """
-    try:
-        last_message_content = data.get_last_message_content()
-        messages = data.get_history_messages()
-
-        doc_ids = data.get_chat_document_ids()
-        filters = generate_filters(doc_ids)
-        params = data.data or {}
-        
-        logger.info(
-            f"Guest chat request with filters: {str(filters)}",
-        )
-
-        event_handler = EventCallbackHandler()
-        chat_engine = get_chat_engine(
-            filters=filters, params=params, query=last_message_content, event_handler=event_handler
-        )
-        chat_engine.callback_manager.handlers.append(event_handler)  # type: ignore
-
-        response = await chat_engine.astream_chat(last_message_content, messages)
-
-        final_response = ""
-        suggested_questions = []
-        source_nodes = []
-        event = []
-        tools = []
-
-        async def enhanced_content_generator():
-            nonlocal final_response, suggested_questions, source_nodes, event, tools
-            async for chunk in VercelStreamResponse.content_generator(
-                request, event_handler, response, data
-            ):
-                yield chunk
-
-                if chunk.startswith(VercelStreamResponse.TEXT_PREFIX):
-                    final_response += json.loads(chunk[2:].strip())
-                elif chunk.startswith(VercelStreamResponse.DATA_PREFIX):
-                    data_chunk = json.loads(chunk[2:].strip())[0]
-                    if data_chunk["type"] == "suggested_questions":
-                        suggested_questions = data_chunk["data"]
-                    elif data_chunk["type"] == "sources":
-                        try:
-                            source_nodes = data_chunk["data"]
-                        except Exception:
-                            source_nodes = []
-                    elif data_chunk["type"] == "events":
-                        try:
-                            event.append(data_chunk["data"])
-                        except Exception:
-                            pass
-                    elif data_chunk["type"] == "tools":
-                        try:
-                            tools = data_chunk["data"]
-                        except Exception:
-                            tools = []
-
-            # Note: Guest conversations are not saved to database
-            logger.info(f"Guest chat completed. Response length: {len(final_response)}")
-
-        return VercelStreamResponse(
-            request,
-            event_handler,
-            response,
-            chat_data=data,
-            content=enhanced_content_generator(),
-        )
-    except Exception as e:
-        logger.exception("Error in guest chat engine", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error in guest chat engine: {e}",
-        ) from e
+    last_message_content = data.get_last_message_content()
+    messages = data.get_history_messages()
+
+    doc_ids = data.get_chat_document_ids()
+    filters = generate_filters(doc_ids)
+    params = data.data or {}
+
+    logger.info(
+        f"Guest chat request with filters: {str(filters)}",
+    )
+
+    event_handler = EventCallbackHandler()
+    chat_engine = await get_chat_engine(
+        filters=filters, params=params, query=last_message_content, event_handler=event_handler
+    )
+    chat_engine.callback_manager.handlers.append(event_handler)  # type: ignore
+
+    response = await chat_engine.astream_chat(last_message_content, messages)
+
+    async def enhanced_content_generator():
+        # Guests have no conversation to persist, so the streamed chunks are only
+        # passed through; count the encoded text size for the log instead of decoding
+        response_size = 0
+        async for chunk in VercelStreamResponse.content_generator(
+            request, event_handler, response, data
+        ):
+            yield chunk
+            if chunk.startswith(VercelStreamResponse.TEXT_PREFIX):
+                response_size += len(chunk)
+
+        # Note: Guest conversations are not saved to database
+        logger.info(f"Guest chat completed. Response size: {response_size} chars (encoded)")
+
+    return VercelStreamResponse(
+        request,
+        event_handler,
+        response,
+        chat_data=data,
+        content=enhanced_content_generator(),
+    )
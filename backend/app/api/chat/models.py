@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Set
 
 from llama_index.core.llms import ChatMessage, MessageRole
 from llama_index.core.schema import NodeWithScore
@@ -11,6 +11,14 @@ from app.config import DATA_DIR
 
 logger = logging.getLogger("uvicorn")
 
+# Only the most recent history is sent to the chat engine (0 = no limit)
+CHAT_HISTORY_MAX_MESSAGES = int(os.getenv("CHAT_HISTORY_MAX_MESSAGES", "20"))
+
+# Resolved once instead of per source node
+FILESERVER_URL_PREFIX = os.getenv("FILESERVER_URL_PREFIX")
+_DATA_DIR_ABSPATH = os.path.abspath(DATA_DIR)
+_url_prefix_warned = False
+
 
 class FileContent(BaseModel):
     type: Literal["text", "ref"]
@@ -121,11 +129,14 @@ class ChatData(BaseModel):
 
     def get_history_messages(self) -> List[ChatMessage]:
         """
-        Get the history messages
+        Get the history messages, limited to the last CHAT_HISTORY_MAX_MESSAGES
         """
+        history = self.messages[:-1]
+        if CHAT_HISTORY_MAX_MESSAGES > 0:
+            history = history[-CHAT_HISTORY_MAX_MESSAGES:]
         return [
             ChatMessage(role=message.role, content=message.content)
-            for message in self.messages[:-1]
+            for message in history
         ]
 
     def is_last_message_from_user(self) -> bool:
@@ -135,7 +146,7 @@ class ChatData(BaseModel):
         """
         Get the document IDs from the chat messages
         """
-        document_ids: List[str] = []
+        document_ids: Set[str] = set()
         for message in self.messages:
             if message.role == MessageRole.USER and message.annotations is not None:
                 for annotation in message.annotations:
@@ -145,8 +156,8 @@ class ChatData(BaseModel):
                     ):
                         for fi in annotation.data.files:
                             if fi.content.type == "ref":
-                                document_ids += fi.content.value
-        return list(set(document_ids))
+                                document_ids.update(fi.content.value)
+        return list(document_ids)
 
 
 class SourceNodes(BaseModel):
@@ -171,8 +182,10 @@ class SourceNodes(BaseModel):
 
     @classmethod
     def get_url_from_metadata(cls, metadata: Dict[str, Any]) -> str:
-        url_prefix = os.getenv("FILESERVER_URL_PREFIX")
-        if not url_prefix:
+        global _url_prefix_warned
+        url_prefix = FILESERVER_URL_PREFIX
+        if not url_prefix and not _url_prefix_warned:
+            _url_prefix_warned = True
             logger.warning(
                 "Warning: FILESERVER_URL_PREFIX not set in environment variables. Can't use file server"
             )
@@ -192,9 +205,8 @@ class SourceNodes(BaseModel):
             # file is from calling the 'generate' script
             # Get the relative path of file_path to data_dir
             file_path = metadata.get("file_path")
-            data_dir = os.path.abspath(DATA_DIR)
-            if file_path and data_dir:
-                relative_path = os.path.relpath(file_path, data_dir)
+            if file_path:
+                relative_path = os.path.relpath(file_path, _DATA_DIR_ABSPATH)
                 return f"{url_prefix}/data/{relative_path}"
         # fallback to URL in metadata (e.g. for websites, web search)
         return metadata.get("URL") or metadata.get("url")
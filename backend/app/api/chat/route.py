@@ -1,10 +1,11 @@
+import asyncio
 import base64
-import json
 import logging
 import os
-import re
+import tempfile
 import uuid
-from typing import List, Dict, Any, Optional
+from typing import Optional
+import orjson
 from fastapi import (
     APIRouter,
     Depends,
@@ -13,17 +14,10 @@ from fastapi import (
     status,
     Query,
 )
-from fastapi.responses import StreamingResponse
-from llama_index.core.chat_engine.types import BaseChatEngine, NodeWithScore
 from llama_index.core.llms import MessageRole
 
 from app.api.chat.events import EventCallbackHandler
-from app.api.chat.models import (
-    ChatData,
-    Message,
-    Result,
-    SourceNodes,
-)
+from app.api.chat.models import ChatData
 from app.api.chat.vercel_response import VercelStreamResponse
 from app.api.chat.engine import get_chat_engine
 from app.api.chat.engine.query_filter import generate_filters
@@ -38,6 +32,10 @@ chat_router = r = APIRouter()
 logger = logging.getLogger("uvicorn")
 
 UPLOAD_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "output", "uploaded")
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(25 * 1024 * 1024)))
+# Read once at import (os.umask can only be queried by setting it, which isn't thread-safe)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 
 @r.post("/upload", summary="Upload file for chat (base64)")
@@ -50,19 +48,59 @@ async def chat_upload(
     if not base64_data:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="base64 required")
     filename = body.get("filename") or "upload"
+    if "," in base64_data:
+        base64_data = base64_data.split(",", 1)[1]
+    # base64 encodes 3 bytes in 4 chars; reject before decoding anything
+    if len(base64_data) * 3 // 4 > MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds the {MAX_UPLOAD_BYTES} byte upload limit",
+        )
+    ext = os.path.splitext(filename)[1] or ".bin"
+    # Decoding and writing large files is blocking work; keep it off the event loop
     try:
-        if "," in base64_data:
-            base64_data = base64_data.split(",", 1)[1]
-        raw = base64.b64decode(base64_data)
-    except Exception as e:
+        safe_name = await asyncio.to_thread(_save_upload, base64_data, ext)
+    except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid base64: {e}")
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
-    ext = os.path.splitext(filename)[1] or ".bin"
+    return [safe_name]
+
+
+def _discard_task(task: Optional[asyncio.Task]) -> None:
+    """Cancel a task that is no longer needed, or consume its result if it already finished."""
+    if task is None:
+        return
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+def _save_upload(base64_data: str, ext: str) -> str:
+    """Decode and store the file under a random name; return that name."""
+    raw = base64.b64decode(base64_data)
+    # The upload dir is served without auth, so the unguessable name is what keeps files private
     safe_name = f"{uuid.uuid4().hex}{ext}"
     path = os.path.join(UPLOAD_DIR, safe_name)
-    with open(path, "wb") as f:
-        f.write(raw)
-    return [safe_name]
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    # Write next to the target and rename, so a partially written file is never
+    # visible under its final name
+    with tempfile.NamedTemporaryFile(dir=UPLOAD_DIR, delete=False) as f:
+        try:
+            f.write(raw)
+            f.flush()
+            # Temp files are created 0600; give the upload the usual mode so the
+            # file server (possibly another user) can still read it
+            os.chmod(f.name, 0o666 & ~_UMASK)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    try:
+        os.replace(f.name, path)
+    except BaseException:
+        os.unlink(f.name)
+        raise
+    return safe_name
 
 
 # streaming endpoint - delete if not needed
@@ -79,61 +117,69 @@ async def chat(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Conversation ID is required for authenticated requests.",
         )
-    try:
-        USER_ID = current_user.email
-        conversation = await conversation_service.get_or_create_conversation(
-            conversation_id, USER_ID
-        )
-        if conversation:
-            stored_messages = conversation.get("messages", [])
-            incoming_messages = data.messages
-            if len(incoming_messages) < len(stored_messages):
-                await conversation_service.truncate_conversation(
-                    conversation_id, len(incoming_messages), USER_ID
-                )
-
-        if conversation.get("summary") == "New Chat":
-            if len(data.messages) <= 2:
-                summary = await summary_generator(data.messages)
-        else:
-            try:
-                summary = conversation.get("summary")
-            except Exception as e:
-                summary = "New Chat"
-        last_message_content = data.get_last_message_content()
-        messages = data.get_history_messages()
-
-        await conversation_service.update_conversation(
-            conversation_id,
-            {"role": MessageRole.USER, "content": last_message_content},
-            user_id=USER_ID,
-        )
+    USER_ID = current_user.email
+    conversation = await conversation_service.get_or_create_conversation(
+        conversation_id, USER_ID
+    )
+    message_count = len(data.messages)
+    if conversation:
+        stored_messages = conversation.get("messages", [])
+        if message_count < len(stored_messages):
+            await conversation_service.truncate_conversation(
+                conversation_id, message_count, USER_ID
+            )
 
+    # Title new conversations from their first exchange; generated alongside the answer
+    summary = None
+    summary_task = None
+    if conversation.get("summary") == "New Chat":
+        if message_count <= 2:
+            summary_task = asyncio.create_task(summary_generator(data.messages))
+    else:
+        summary = conversation.get("summary")
+    last_message_content = data.get_last_message_content()
+    messages = data.get_history_messages()
 
-        doc_ids = data.get_chat_document_ids()
-        filters = generate_filters(doc_ids)
-        params = data.data or {}
-        logger.info(
-            f"Creating chat engine with filters: {str(filters)}",
-        )
-        event_handler = EventCallbackHandler()
+    doc_ids = data.get_chat_document_ids()
+    filters = generate_filters(doc_ids)
+    params = data.data or {}
+    logger.info(
+        f"Creating chat engine with filters: {str(filters)}",
+    )
+    event_handler = EventCallbackHandler()
+
+    async def start_chat_stream():
         # Pass the query to enable legal context detection; pass handler so web search can emit events
-        chat_engine = get_chat_engine(
+        chat_engine = await get_chat_engine(
             filters=filters, params=params, query=last_message_content, event_handler=event_handler
         )
         chat_engine.callback_manager.handlers.append(event_handler)  # type: ignore
+        return await chat_engine.astream_chat(last_message_content, messages)
 
-        response = await chat_engine.astream_chat(last_message_content, messages)
-        # process_response_nodes(response.source_nodes, background_tasks)
+    # Persisting the user message doesn't affect the answer, so overlap it with retrieval
+    try:
+        _, response = await asyncio.gather(
+            conversation_service.update_conversation(
+                conversation_id,
+                {"role": MessageRole.USER, "content": last_message_content},
+                user_id=USER_ID,
+            ),
+            start_chat_stream(),
+        )
+    except BaseException:
+        _discard_task(summary_task)
+        raise
+    # process_response_nodes(response.source_nodes, background_tasks)
 
-        final_response = ""
-        suggested_questions = []
-        source_nodes = []
-        event = []
-        tools = []
+    final_response = ""
+    suggested_questions = []
+    source_nodes = []
+    event = []
+    tools = []
 
-        async def enhanced_content_generator():
-            nonlocal final_response, suggested_questions, source_nodes, event, tools, summary
+    async def enhanced_content_generator():
+        nonlocal final_response, suggested_questions, source_nodes, tools, summary
+        try:
             async for chunk in VercelStreamResponse.content_generator(
                 request, event_handler, response, data
             ):
@@ -141,9 +187,9 @@ async def chat(
                 yield chunk
 
                 if chunk.startswith(VercelStreamResponse.TEXT_PREFIX):
-                    final_response += json.loads(chunk[2:].strip())
+                    final_response += orjson.loads(chunk[2:])
                 elif chunk.startswith(VercelStreamResponse.DATA_PREFIX):
-                    data_chunk = json.loads(chunk[2:].strip())[0]
+                    data_chunk = orjson.loads(chunk[2:])[0]
                     if data_chunk["type"] == "suggested_questions":
                         suggested_questions = data_chunk["data"]
                     elif data_chunk["type"] == "sources":
@@ -165,6 +211,13 @@ async def chat(
                         except Exception:
                             tools = []
 
+            if summary_task is not None:
+                try:
+                    summary = await summary_task
+                except Exception:
+                    # The title is cosmetic; keep "New Chat" rather than losing the answer
+                    logger.exception("Failed to generate conversation summary")
+
             await conversation_service.update_conversation(
                 conversation_id,
                 {
@@ -183,20 +236,18 @@ async def chat(
                 summary=summary,
                 user_id=USER_ID,
             )
+        finally:
+            # Don't leave the title task running (or its error unretrieved) when the
+            # client disconnects or streaming fails before it was awaited
+            _discard_task(summary_task)
 
-        return VercelStreamResponse(
-            request,
-            event_handler,
-            response,
-            chat_data=data,
-            content=enhanced_content_generator(),
-        )
-    except Exception as e:
-        logger.exception("Error in chat engine", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error in chat engine: {e}",
-        ) from e
+    return VercelStreamResponse(
+        request,
+        event_handler,
+        response,
+        chat_data=data,
+        content=enhanced_content_generator(),
+    )
 
 
 
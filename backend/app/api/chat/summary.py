@@ -2,6 +2,21 @@ from typing import List
 from app.api.chat.models import Message
 from llama_index.core.settings import Settings
 
+# A title only needs the gist; long answers are truncated before prompting
+_SUMMARY_MESSAGE_MAX_CHARS = 1000
+
+_SUMMARY_PROMPT_TMPL = """
+        You are an AI Legal Assistant specialized in Indian law.
+
+        Here is the conversation history
+        \n---------------------\n{conversation}\n---------------------\n
+        Given the a conversation between a user and a legal AI assistant
+        give me one line summary of the conversation so that is instantly recognizable 
+        make sure its really short don't mention user or assistant in the summary 
+        dont start with conversation , discussion , inquiry it should always start with a keyboard of the conversation
+        the summary should be short less then 5 to 10 words, straight to the point and distinct 
+        """
+
 
 async def summary_generator(
     messages: List[Message],
@@ -11,26 +26,17 @@ async def summary_generator(
     last_assistant_message = None
     for message in reversed(messages):
         if message.role == "user":
-            last_user_message = f"User: {message.content}"
+            last_user_message = f"User: {message.content[:_SUMMARY_MESSAGE_MAX_CHARS]}"
         elif message.role == "assistant":
-            last_assistant_message = f"Assistant: {message.content}"
+            last_assistant_message = f"Assistant: {message.content[:_SUMMARY_MESSAGE_MAX_CHARS]}"
         if last_user_message and last_assistant_message:
             break
-    conversation: str = f"{last_user_message}\n{last_assistant_message}"
+    conversation: str = "\n".join(
+        m for m in (last_user_message, last_assistant_message) if m
+    )
 
     response = await Settings.llm.acomplete(
-        prompt=f"""
-        You are an AI Legal Assistant specialized in Indian law.
-
-        Here is the conversation history
-        \n---------------------\n{messages}\n---------------------\n
-        Given the a conversation between a user and a legal AI assistant
-        give me one line summary of the conversation so that is instantly recognizable 
-        make sure its really short don't mention user or assistant in the summary 
-        dont start with conversation , discussion , inquiry it should always start with a keyboard of the conversation
-        the summary should be short less then 5 to 10 words, straight to the point and distinct 
-        """,
+        prompt=_SUMMARY_PROMPT_TMPL.format(conversation=conversation),
         formatted=False,
     )
-    # print(response)
-    return str(response)
+    return response.text
@@ -1,5 +1,4 @@
-import json
-
+import orjson
 from aiostream import stream
 from fastapi import Request
 from fastapi.responses import StreamingResponse
@@ -21,12 +20,12 @@ class VercelStreamResponse(StreamingResponse):
     @classmethod
     def convert_text(cls, token: str):
         # Escape newlines and double quotes to avoid breaking the stream
-        token = json.dumps(token)
+        token = orjson.dumps(token).decode()
         return f"{cls.TEXT_PREFIX}{token}\n"
 
     @classmethod
     def convert_data(cls, data: dict):
-        data_str = json.dumps(data)
+        data_str = orjson.dumps(data).decode()
         return f"{cls.DATA_PREFIX}[{data_str}]\n"
 
     def __init__(
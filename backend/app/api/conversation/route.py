@@ -1,7 +1,6 @@
 import logging
 from pydantic import BaseModel
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any
 from bson import ObjectId
 from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.responses import JSONResponse
@@ -21,36 +20,24 @@ load_dotenv()
 async def get_new_conversation(
     current_user: User = Depends(get_current_user),
 ):
-    try:
-        new_conversation_id = ObjectId()
-        # user_email = current_user.get("email") if current_user else None
-        user_email = current_user.email
+    new_conversation_id = ObjectId()
+    # user_email = current_user.get("email") if current_user else None
+    user_email = current_user.email
 
-        await conversation_service.get_or_create_conversation(
-            str(new_conversation_id), user_email
-        )
-        return {"conversation_id": str(new_conversation_id)}
-    except Exception as e:
-        logger.exception("Error creating new conversation", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error creating new conversation: {e}",
-        ) from e
+    await conversation_service.get_or_create_conversation(
+        str(new_conversation_id), user_email
+    )
+    return {"conversation_id": str(new_conversation_id)}
 
 
 @conversation_router.get("/list")
 async def get_conversation_history(
     current_user: Dict[str, Any] = Depends(get_current_user),
 ):
-    try:
-        conversations_by_date = (
-            await conversation_service.get_all_conversations_for_user(
-                current_user.email
-            )
-        )
-        return {"conversations": conversations_by_date}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    conversations_by_date = await conversation_service.get_all_conversations_for_user(
+        current_user.email
+    )
+    return {"conversations": conversations_by_date}
 
 
 @conversation_router.get("/{conversation_id}")
@@ -78,28 +65,21 @@ async def get_sharable_conversation(conversation_id: str):
 async def delete_conversation(
     conversation_id: str, current_user: Dict[str, Any] = Depends(get_current_user)
 ):
-    try:
-        deleted_count = await conversation_service.delete_conversation(
-            conversation_id, current_user.email
+    deleted_count = await conversation_service.delete_conversation(
+        conversation_id, current_user.email
+    )
+    if deleted_count == 1:
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={
+                "message": f"Conversation {conversation_id} deleted successfully."
+            },
         )
-        if deleted_count == 1:
-            return JSONResponse(
-                status_code=status.HTTP_200_OK,
-                content={
-                    "message": f"Conversation {conversation_id} deleted successfully."
-                },
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Conversation {conversation_id} not found for the current user.",
-            )
-    except Exception as e:
-        logger.exception("Error deleting conversation", exc_info=True)
+    else:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error deleting conversation: {e}",
-        ) from e
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Conversation {conversation_id} not found for the current user.",
+        )
 
 
 class ConversationSummaryUpdate(BaseModel):
@@ -111,30 +91,19 @@ async def edit_conversation_sharable(
     conversation_id: str,
     current_user: User = Depends(get_current_user),
 ):
-    try:
-        success = await conversation_service.make_conversation_sharable(
-            conversation_id, current_user.email
+    success = await conversation_service.make_conversation_sharable(
+        conversation_id, current_user.email
+    )
+    if success:
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={"message": f"Conversation {conversation_id} is now shareable."},
         )
-        if success:
-            return JSONResponse(
-                status_code=status.HTTP_200_OK,
-                content={
-                    "message": f"Conversation {conversation_id} is now shareable."
-                },
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Conversation {conversation_id} not found for the current user.",
-            )
-    except HTTPException as he:
-        raise he
-    except Exception as e:
-        logger.exception("Error updating conversation shareable status", exc_info=True)
+    else:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error updating conversation shareable status: {str(e)}",
-        ) from e
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Conversation {conversation_id} not found for the current user.",
+        )
 
 
 @conversation_router.patch("/{conversation_id}/summary")
@@ -143,25 +112,18 @@ async def edit_conversation_summary(
     summary_update: ConversationSummaryUpdate,
     current_user: User = Depends(get_current_user),
 ):
-    try:
-        matched_count = await conversation_service.edit_conversation_summary(
-            conversation_id, current_user.email, summary_update.summary
+    matched_count = await conversation_service.edit_conversation_summary(
+        conversation_id, current_user.email, summary_update.summary
+    )
+    if matched_count == 1:
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={
+                "message": f"Summary for conversation {conversation_id} updated successfully."
+            },
         )
-        if matched_count == 1:
-            return JSONResponse(
-                status_code=status.HTTP_200_OK,
-                content={
-                    "message": f"Summary for conversation {conversation_id} updated successfully."
-                },
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Conversation {conversation_id} not found for the current user.",
-            )
-    except Exception as e:
-        logger.exception("Error updating conversation summary", exc_info=True)
+    else:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error updating conversation summary: {e}",
-        ) from e
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Conversation {conversation_id} not found for the current user.",
+        )
@@ -1,6 +1,7 @@
 import os
 from fastapi import APIRouter, HTTPException
 
+from app.api.chat.engine.vectordb import get_qdrant_clients
 from app.db import async_mongodb
 
 health_router = APIRouter()
@@ -26,12 +27,8 @@ async def health():
         out["qdrant"] = "not configured"
     else:
         try:
-            import qdrant_client
-            client = qdrant_client.QdrantClient(
-                url=url,
-                api_key=os.getenv("QDRANT_API_KEY") or None,
-            )
-            client.get_collections()
+            _, aclient = get_qdrant_clients()
+            await aclient.get_collections()
             out["qdrant"] = "ok"
         except Exception as e:
             out["ok"] = False
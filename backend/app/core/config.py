@@ -12,6 +12,8 @@ class Settings(BaseSettings):
     ALGORITHM: ClassVar[str] = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
+    # bcrypt cost factor for new hashes; existing hashes keep the cost they were made with
+    BCRYPT_ROUNDS: int = config("BCRYPT_ROUNDS", default=12, cast=int)
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = ["http://localhost:3000"]
     PROJECT_NAME: str = "NYAYANTAR"
     COOKIE_SECURE: bool = False
@@ -33,7 +33,9 @@ def _password_bytes(password: str) -> bytes:
 
 
 def get_password(password: str) -> str:
-    return bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(
+        _password_bytes(password), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    ).decode("utf-8")
 
 
 def verify_password(password: str, hashed_pass: str) -> bool:
@@ -14,11 +14,35 @@ MONGODB_NAME = os.getenv("MONGODB_NAME", "nyayantar")
 
 CONFIG_FILE = "rag_config.json"
 
+# CONVERSATION_STARTERS may be separated by commas and/or newlines
+_STARTERS_SEPARATOR_RE = re.compile(r"[,\n]+")
+
 
 MAX_RETRIES = 5
 RETRY_DELAY = 5
 
 
+def _build_initial_config():
+    """Initial system prompt and conversation starters from the environment"""
+    conversation_starters = [
+        starter.strip()
+        for starter in _STARTERS_SEPARATOR_RE.split(os.getenv("CONVERSATION_STARTERS", ""))
+        if starter.strip()
+    ]
+    return {
+        "SYSTEM_PROMPT": os.getenv("SYSTEM_PROMPT", ""),
+        "CONVERSATION_STARTERS": conversation_starters,
+    }
+
+
+def _write_config_file(initial_config):
+    with open(CONFIG_FILE, "w") as f:
+        json.dump(initial_config, f, indent=2)
+
+    print("System prompt and conversation starters initialized")
+    print(f"Conversation starters: {initial_config['CONVERSATION_STARTERS']}")
+
+
 class AsyncMongoDB:
     client: AsyncIOMotorClient = None
     db = None
@@ -59,27 +83,10 @@ class AsyncMongoDB:
             print("Configuration already exists. Skipping initialization.")
             return
 
-        # Initialize system prompt and conversation starters
-        system_prompt = os.getenv("SYSTEM_PROMPT", "")
-        conversation_starters_raw = os.getenv("CONVERSATION_STARTERS", "")
-
-        conversation_starters = re.split(r"[,\n]+", conversation_starters_raw)
-        conversation_starters = [
-            starter.strip() for starter in conversation_starters if starter.strip()
-        ]
-
-        initial_config = {
-            "SYSTEM_PROMPT": system_prompt,
-            "CONVERSATION_STARTERS": conversation_starters,
-        }
+        initial_config = _build_initial_config()
 
         await config_collection.insert_one({"_id": "app_config", **initial_config})
-
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(initial_config, f, indent=2)
-
-        print("System prompt and conversation starters initialized")
-        print(f"Conversation starters: {conversation_starters}")
+        _write_config_file(initial_config)
 
 
 class SyncMongoDB:
@@ -120,27 +127,10 @@ class SyncMongoDB:
             print("Configuration already exists. Skipping initialization.")
             return
 
-        # Initialize system prompt and conversation starters
-        system_prompt = os.getenv("SYSTEM_PROMPT", "")
-        conversation_starters_raw = os.getenv("CONVERSATION_STARTERS", "")
-
-        conversation_starters = re.split(r"[,\n]+", conversation_starters_raw)
-        conversation_starters = [
-            starter.strip() for starter in conversation_starters if starter.strip()
-        ]
-
-        initial_config = {
-            "SYSTEM_PROMPT": system_prompt,
-            "CONVERSATION_STARTERS": conversation_starters,
-        }
+        initial_config = _build_initial_config()
 
         config_collection.insert_one({"_id": "app_config", **initial_config})
-
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(initial_config, f, indent=2)
-
-        print("System prompt and conversation starters initialized")
-        print(f"Conversation starters: {conversation_starters}")
+        _write_config_file(initial_config)
 
 
 async_mongodb = AsyncMongoDB()
@@ -0,0 +1,48 @@
+import logging
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("uvicorn")
+
+
+class UnhandledErrorMiddleware:
+    """
+    Convert exceptions that escape a route into a 500 JSON response.
+
+    Routes raise HTTPException for expected errors and let anything else bubble
+    up to here, instead of wrapping every endpoint body in try/except.
+    Must be added before CORSMiddleware so error responses still get CORS headers.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            # Once a (streaming) response has started we can't send another one
+            if response_started:
+                raise
+            # The full error is logged; clients get a fixed message so internal
+            # (Mongo/Qdrant/LLM) details never leak into response bodies
+            logger.exception(f"Unhandled error in {scope['method']} {scope['path']}")
+            response = JSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={"detail": "Internal server error"},
+            )
+            await response(scope, receive, send)
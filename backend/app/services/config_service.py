@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
 from app.db import async_mongodb
 from app.api.chat.models import ChatConfig
 
@@ -1,7 +1,6 @@
 import logging
-from pydantic import BaseModel
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
 from bson import ObjectId
 from dotenv import load_dotenv
 from app.db import async_mongodb
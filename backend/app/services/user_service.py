@@ -1,3 +1,4 @@
+import asyncio
 import os
 from typing import Optional
 from uuid import UUID
@@ -6,24 +7,34 @@ from app.models.user_model import User
 from app.core.security import get_password, verify_password
 from pymongo.errors import DuplicateKeyError
 from bson import Binary
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from app.db import async_mongodb
 
 # Load environment variables
 load_dotenv()
 
+# Seconds a user looked up by id is served from memory
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "60"))
+
 
 class UserService:
+    def __init__(self):
+        # get_current_user resolves the user on every authenticated request
+        self._user_cache = TTLCache(maxsize=1024, ttl=USER_CACHE_TTL)
+
     @property
     def users_collection(self):
         return async_mongodb.db.users
 
     async def create_user(self, user: UserAuth) -> User:
+        # bcrypt is deliberately slow CPU work; keep it off the event loop
+        hashed_password = await asyncio.to_thread(get_password, user.password)
         user_obj = User(
             email=user.email,
             first_name=user.first_name,
             last_name=user.last_name,
-            hashed_password=get_password(user.password),
+            hashed_password=hashed_password,
             role="user",  # Set default role to "user"
         )
         user_dict = user_obj.to_mongo()
@@ -39,7 +50,9 @@ class UserService:
         user = await self.get_user_by_email(email=email)
         if not user:
             return None
-        if not verify_password(password=password, hashed_pass=user.hashed_password):
+        if not await asyncio.to_thread(
+            verify_password, password=password, hashed_pass=user.hashed_password
+        ):
             return None
         return user
 
@@ -54,7 +67,7 @@ class UserService:
         user = await self.get_user_by_email(email=email)
         if user:
             return user
-        placeholder = get_password(os.urandom(32).hex())
+        placeholder = await asyncio.to_thread(get_password, os.urandom(32).hex())
         user_obj = User(
             email=email,
             hashed_password=placeholder,
@@ -70,10 +83,17 @@ class UserService:
             return await self.get_user_by_email(email=email)
 
     async def get_user_by_id(self, id: UUID) -> Optional[User]:
+        user = self._user_cache.get(id)
+        if user is not None:
+            return user
         user_dict = await self.users_collection.find_one(
             {"user_id": Binary.from_uuid(id)}
         )
-        return User.from_mongo(user_dict) if user_dict else None
+        if not user_dict:
+            return None
+        user = User.from_mongo(user_dict)
+        self._user_cache[id] = user
+        return user
 
     async def update_user(self, id: UUID, data: UserUpdate) -> User:
         update_data = data.model_dump(exclude_unset=True)
@@ -84,6 +104,7 @@ class UserService:
         if result.modified_count == 0:
             raise ValueError("User not found")
 
+        self._user_cache.pop(id, None)
         updated_user = await self.get_user_by_id(id)
         return updated_user
 
@@ -56,6 +56,7 @@ def _init_openai():
         "model": embed_model,
         "api_key": api_key,
         "api_base": OPENAI_BASE_URL,
+        "embed_batch_size": int(os.getenv("EMBEDDING_BATCH_SIZE", "100")),
     }
     if dimensions:
         embed_config["dimensions"] = int(dimensions)
@@ -92,5 +93,6 @@ def _init_fastembed():
         "paraphrase-multilingual-mpnet-base-v2": "sentence-transformers/paraphrase-multilingual-mpnet-base-v2",
     }
     Settings.embed_model = FastEmbedEmbedding(
-        model_name=model_map.get(name, "sentence-transformers/all-MiniLM-L6-v2")
+        model_name=model_map.get(name, "sentence-transformers/all-MiniLM-L6-v2"),
+        embed_batch_size=int(os.getenv("EMBEDDING_BATCH_SIZE", "64")),
     )
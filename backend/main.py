@@ -10,7 +10,6 @@ from app.config import DATA_DIR
 
 import logging
 import os
-import json
 
 import uvicorn
 
@@ -20,6 +19,7 @@ from app.api.chat import guest_router
 from app.api.auth import auth_router
 from app.api.conversation import conversation_router
 from app.api.health import health_router
+from app.middleware import UnhandledErrorMiddleware
 from app.observability import init_observability
 from app.settings import init_settings
 from app.db import async_mongodb, sync_mongodb
@@ -51,6 +51,9 @@ init_observability()
 environment = os.getenv("ENVIRONMENT", "dev")  # Default to 'development' if not set
 logger = logging.getLogger("uvicorn")
 
+# Added before CORS so that CORS wraps it and error responses keep CORS headers
+app.add_middleware(UnhandledErrorMiddleware)
+
 # if environment == "dev":
 #     logger.warning("Running in development mode - allowing CORS for all origins")
 app.add_middleware(